@@ -4,7 +4,9 @@ Crius Swiss - Swiss Ephemeris adapter implementation.
 Named after Crius, the Titan of constellations and measuring the year.
 """
 
-from .adapter import SwissEphemerisAdapter
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     CriusSwissError,
     EphemerisFileNotFoundError,
@@ -12,16 +14,49 @@ from .exceptions import (
     InvalidHouseSystemError,
     InvalidAyanamsaError,
 )
-from .cache import EphemerisCache, CachedSwissEphemerisAdapter
 from .validation import (
+    DEFAULT_REQUIRED_FILES,
     validate_ephemeris_path,
     validate_ephemeris_files,
     check_file_integrity,
+    check_file_integrity_entry,
     find_ephemeris_files,
+    iter_ephemeris_files,
 )
 
+if TYPE_CHECKING:
+    from .adapter import SwissEphemerisAdapter, PlanetArrays
+    from .cache import CachedSwissEphemerisAdapter
+    from .ephemeris_cache import EphemerisCache
+
+# Names loaded on first access (PEP 562), mapped to their submodule, so
+# importing only exceptions or validation helpers does not load swisseph
+_LAZY_IMPORTS = {
+    "SwissEphemerisAdapter": "adapter",
+    "PlanetArrays": "adapter",
+    "EphemerisCache": "ephemeris_cache",
+    "CachedSwissEphemerisAdapter": "cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import adapter and cache classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including not-yet-loaded lazy names."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
 __all__ = [
     "SwissEphemerisAdapter",
+    "PlanetArrays",
     "CriusSwissError",
     "EphemerisFileNotFoundError",
     "EphemerisCalculationError",
@@ -29,10 +64,13 @@ __all__ = [
     "InvalidAyanamsaError",
     "EphemerisCache",
     "CachedSwissEphemerisAdapter",
+    "DEFAULT_REQUIRED_FILES",
     "validate_ephemeris_path",
     "validate_ephemeris_files",
     "check_file_integrity",
+    "check_file_integrity_entry",
     "find_ephemeris_files",
+    "iter_ephemeris_files",
 ]
 
 __version__ = "0.1.0"
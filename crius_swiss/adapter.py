@@ -5,11 +5,12 @@ This module provides a Swiss Ephemeris adapter that conforms to the
 crius-ephemeris-core EphemerisAdapter protocol.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence
 import os
+import threading
 import swisseph as swe
-import pytz
 
 from crius_ephemeris_core import (
     EphemerisSettings,
@@ -28,6 +29,11 @@ from .exceptions import (
 )
 from .validation import validate_ephemeris_path as _validate_ephemeris_path_module
 
+# libswe keeps the ephemeris path and sidereal mode in thread-local storage
+# shared by every adapter; track what is applied on each thread so adapters
+# only reconfigure libswe when its state differs from what they need
+_swe_state = threading.local()
+
 # Swiss Ephemeris planet IDs
 SWEPH_PLANET_IDS = {
     "sun": swe.SUN,
@@ -44,6 +50,9 @@ SWEPH_PLANET_IDS = {
     "north_node": swe.TRUE_NODE,
 }
 
+# Reverse lookup, only used to name the body in error messages
+_PLANET_NAMES = {swe_id: planet_id for planet_id, swe_id in SWEPH_PLANET_IDS.items()}
+
 # House system mapping
 HOUSE_SYSTEM_MAP = {
     "placidus": b"P",
@@ -56,6 +65,9 @@ HOUSE_SYSTEM_MAP = {
     "morinus": b"M",
 }
 
+# House cusp keys, "1" through "12"
+_HOUSE_KEYS = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12")
+
 # Common ayanamsa mappings for Swiss Ephemeris
 DEFAULT_AYANAMSA = swe.SIDM_LAHIRI
 AYANAMSA_MAP = {
@@ -78,36 +90,128 @@ SIGNS = [
     "aries", "taurus", "gemini", "cancer", "leo", "virgo",
     "libra", "scorpio", "sagittarius", "capricorn", "aquarius", "pisces"
 ]
+_SIGNS = tuple(SIGNS)
+
+# Seconds to fractional hours, for Julian Day conversion
+_HOURS_PER_SECOND = 1.0 / 3600.0
+
+
+class PlanetArrays(NamedTuple):
+    """
+    Planet positions in column (structure-of-arrays) form.
+
+    Every field is a tuple with one entry per body, aligned with ``ids``,
+    so the columns can be handed straight to vectorized consumers
+    (e.g. ``numpy.asarray(arrays.lon)``).
+    """
+
+    ids: tuple[str, ...]
+    lon: tuple[float, ...]
+    lat: tuple[float, ...]
+    speed: tuple[float, ...]
+    retro: tuple[bool, ...]
 
 
 def _get_sign(longitude: float) -> str:
     """Get sign name from longitude (0-360)."""
-    normalized = longitude % 360
-    if normalized == 360:
-        normalized = 0
-    sign_index = int(normalized / 30)
-    sign_index = min(max(0, sign_index), 11)
-    return SIGNS[sign_index]
+    # The final % 12 folds a rounded-up 360.0 (e.g. from -1e-20 % 360) back to aries
+    return _SIGNS[int(longitude % 360) // 30 % 12]
+
+
+def _opposite(longitude: float) -> float:
+    """Get the longitude 180 degrees away, normalized to 0-360."""
+    return (longitude + 180) % 360
 
 
 def _datetime_to_jd(dt_utc: datetime) -> float:
     """Convert UTC datetime to Julian Day."""
+    # Whole seconds in integer arithmetic, then one multiply to hours
+    seconds = dt_utc.hour * 3600 + dt_utc.minute * 60 + dt_utc.second
     return swe.julday(
         dt_utc.year,
         dt_utc.month,
         dt_utc.day,
-        dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0,
+        (seconds + dt_utc.microsecond * 1e-6) * _HOURS_PER_SECOND,
         swe.GREG_CAL
     )
 
 
+def _jd_to_datetime(jd: float) -> datetime:
+    """Convert Julian Day back to a (naive, UTC) datetime for error reporting."""
+    year, month, day, hour = swe.revjul(jd, swe.GREG_CAL)
+    return datetime(year, month, day) + timedelta(hours=hour)
+
+
+def _calc_all_planets(jd: float, swe_ids: Sequence[int], flags: int) -> list[tuple]:
+    """
+    Calculate raw positions for several bodies at one Julian Day.
+
+    ``swe.calc_ut`` is bound locally so the loop does nothing but C calls.
+    Speeds are always requested, since retrograde detection depends on them.
+
+    Args:
+        jd: Julian Day (UT)
+        swe_ids: Swiss Ephemeris body IDs (values of SWEPH_PLANET_IDS)
+        flags: Swiss Ephemeris calculation flags
+
+    Returns:
+        One (lon, lat, dist, speed_lon, speed_lat, speed_dist) tuple per
+        body ID, in the same order
+
+    Raises:
+        EphemerisCalculationError: If Swiss Ephemeris fails for any body
+    """
+    calc_ut = swe.calc_ut
+    flags |= swe.FLG_SPEED
+    rows: list[tuple] = []
+
+    # One handler for the whole batch; the failing body is the next row
+    try:
+        for swe_id in swe_ids:
+            rows.append(calc_ut(jd, swe_id, flags)[0])
+    except swe.Error as e:
+        planet_id = _PLANET_NAMES[swe_ids[len(rows)]]
+        raise EphemerisCalculationError(
+            f"Failed to calculate position for {planet_id}: {str(e)}",
+            planet_id=planet_id,
+            datetime=_jd_to_datetime(jd),
+        ) from e
+
+    return rows
+
+
+@lru_cache(maxsize=16)
 def _get_house_system_bytes(house_system: str) -> bytes:
     """Convert house system string to bytes format."""
-    house_system_lower = house_system.lower()
-    if house_system_lower not in HOUSE_SYSTEM_MAP:
+    house_system_bytes = HOUSE_SYSTEM_MAP.get(house_system.lower())
+    if house_system_bytes is None:
         valid_systems = list(HOUSE_SYSTEM_MAP.keys())
         raise InvalidHouseSystemError(house_system, valid_systems)
-    return HOUSE_SYSTEM_MAP[house_system_lower]
+    return house_system_bytes
+
+
+def _resolve_ayanamsa(ayanamsa: Optional[str]) -> int:
+    """Map ayanamsa string to Swiss constant."""
+    if not ayanamsa:
+        return DEFAULT_AYANAMSA
+    mode = AYANAMSA_MAP.get(ayanamsa.lower())
+    if mode is None:
+        valid_ayanamsas = list(AYANAMSA_MAP.keys())
+        raise InvalidAyanamsaError(ayanamsa, valid_ayanamsas)
+    return mode
+
+
+@lru_cache(maxsize=16)
+def _flags_for(zodiac_type: str, ayanamsa: Optional[str]) -> tuple[int, int]:
+    """
+    Get Swiss Ephemeris flags and sidereal mode for a zodiac setting.
+
+    Returns:
+        Tuple of (flags, sidereal_mode); sidereal_mode is -1 for tropical
+    """
+    if zodiac_type == "sidereal":
+        return swe.FLG_SWIEPH | swe.FLG_SIDEREAL, _resolve_ayanamsa(ayanamsa)
+    return swe.FLG_SWIEPH, -1
 
 
 class SwissEphemerisAdapter:
@@ -117,6 +221,8 @@ class SwissEphemerisAdapter:
     Thin wrapper around Swiss Ephemeris library calls that conforms to
     the EphemerisAdapter protocol from crius-ephemeris-core.
     """
+
+    __slots__ = ("ephemeris_path",)
     
     def __init__(self, ephemeris_path: Optional[str] = None, validate_files: bool = True):
         """
@@ -142,7 +248,7 @@ class SwissEphemerisAdapter:
             self._validate_ephemeris_path(ephemeris_path)
         
         swe.set_ephe_path(ephemeris_path)
-        self._current_sidereal_mode: Optional[int] = None
+        _swe_state.ephe_path = ephemeris_path
 
     def _validate_ephemeris_path(self, path: str) -> None:
         """Validate that ephemeris path exists and contains expected files."""
@@ -178,34 +284,52 @@ class SwissEphemerisAdapter:
         jd = _datetime_to_jd(dt_utc)
         house_system_bytes = _get_house_system_bytes(settings["house_system"])
         flags = self._configure_flags(settings)
+        return self._calc_layer(jd, location, settings, house_system_bytes, flags)
 
-        # Calculate planets
-        planets: dict[str, PlanetPosition] = {}
-        include_objects = settings.get("include_objects", [])
-
-        for obj_id in include_objects:
-            obj_id_lower = obj_id.lower()
-
-            # Handle special cases
-            if obj_id_lower == "south_node":
-                # South Node is 180 degrees from North Node
-                north_node_pos = self._calc_planet_position("north_node", jd, flags)
-                if north_node_pos:
-                    south_lon = (north_node_pos["lon"] + 180) % 360
-                    planets["south_node"] = {
-                        "lon": south_lon,
-                        "lat": 0.0,
-                        "speed_lon": north_node_pos["speed_lon"],
-                        "retrograde": north_node_pos["retrograde"],
-                    }
-                continue
+    def calc_positions_batch(
+        self,
+        dts_utc: Sequence[datetime],
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+    ) -> list[LayerPositions]:
+        """
+        Calculate positions for several datetimes sharing one set of settings.
 
-            if obj_id_lower not in SWEPH_PLANET_IDS:
-                continue
+        Settings are resolved and the sidereal mode is configured once for the
+        whole batch rather than once per datetime. Calculations run in order on
+        the calling thread: pyswisseph holds the GIL during every call, so
+        worker threads would not overlap.
+        
+        Args:
+            dts_utc: UTC datetimes for calculation
+            location: Optional geographic location (required for houses)
+            settings: Ephemeris calculation settings
+            
+        Returns:
+            One LayerPositions per datetime, in the same order
+        """
+        house_system_bytes = _get_house_system_bytes(settings["house_system"])
+        flags = self._configure_flags(settings)
+        return [
+            self._calc_layer(_datetime_to_jd(dt_utc), location, settings, house_system_bytes, flags)
+            for dt_utc in dts_utc
+        ]
 
-            planet_pos = self._calc_planet_position(obj_id_lower, jd, flags)
-            if planet_pos:
-                planets[obj_id_lower] = planet_pos
+    def _calc_layer(
+        self,
+        jd: float,
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+        house_system_bytes: bytes,
+        flags: int,
+    ) -> LayerPositions:
+        """Calculate planets and houses for one Julian Day with resolved settings."""
+        # Calculate planets
+        arrays = self._calc_planet_arrays(jd, settings.get("include_objects", []), flags)
+        planets: dict[str, PlanetPosition] = {
+            obj_id: {"lon": lon, "lat": lat, "speed_lon": speed, "retrograde": retro}
+            for obj_id, lon, lat, speed, retro in zip(*arrays)
+        }
 
         # Calculate houses if location is provided
         houses: Optional[HousePositions] = None
@@ -224,37 +348,75 @@ class SwissEphemerisAdapter:
             "houses": houses,
         }
 
-    def _calc_planet_position(self, planet_id: str, jd: float, flags: int) -> Optional[PlanetPosition]:
-        """Calculate position for a single planet."""
-        if planet_id not in SWEPH_PLANET_IDS:
-            return None
-
-        try:
-            result = swe.calc_ut(jd, SWEPH_PLANET_IDS[planet_id], flags)
-            if result and len(result) > 0:
-                positions = result[0]
-                longitude = positions[0] % 360
-                latitude = positions[1] if len(positions) > 1 else 0.0
-                speed_longitude = positions[3] if len(positions) > 3 else 0.0
-                is_retrograde = speed_longitude < 0
-
-                return {
-                    "lon": longitude,
-                    "lat": latitude,
-                    "speed_lon": speed_longitude,
-                    "retrograde": is_retrograde,
-                }
-        except Exception as e:
-            # Raise a more informative error
-            from datetime import datetime
-            dt = swe.revjul(jd, swe.GREG_CAL)
-            dt_obj = datetime(int(dt[0]), int(dt[1]), int(dt[2]), int(dt[3]), int(dt[4]), int(dt[5]))
-            raise EphemerisCalculationError(
-                f"Failed to calculate position for {planet_id}: {str(e)}",
-                planet_id=planet_id,
-                datetime=dt_obj,
-            ) from e
-        return None
+    def calc_planet_arrays(self, dt_utc: datetime, settings: EphemerisSettings) -> PlanetArrays:
+        """
+        Calculate planetary positions as parallel columns.
+
+        Computes the same bodies and values as the ``planets`` part of
+        calc_positions, without building a dict per body.
+
+        Args:
+            dt_utc: UTC datetime for calculation
+            settings: Ephemeris calculation settings
+
+        Returns:
+            PlanetArrays with one entry per requested (and supported) object
+        """
+        jd = _datetime_to_jd(dt_utc)
+        flags = self._configure_flags(settings)
+        return self._calc_planet_arrays(jd, settings.get("include_objects", []), flags)
+
+    def _calc_planet_arrays(
+        self, jd: float, include_objects: Sequence[str], flags: int
+    ) -> PlanetArrays:
+        """Calculate all requested planets in one batch, in column form."""
+        # Lowercase each ID once and drop duplicates; the south node is
+        # derived from the north node, so it maps to the north node's body
+        requested: list[str] = []
+        swe_ids: list[int] = []
+        wanted: set[str] = set()
+        for obj_id in include_objects:
+            obj_id_lower = obj_id.lower()
+            if obj_id_lower in wanted:
+                continue
+            if obj_id_lower == "south_node":
+                swe_id = SWEPH_PLANET_IDS["north_node"]
+            else:
+                swe_id = SWEPH_PLANET_IDS.get(obj_id_lower)
+                if swe_id is None:
+                    continue
+            wanted.add(obj_id_lower)
+            requested.append(obj_id_lower)
+            swe_ids.append(swe_id)
+
+        # Calculate each body once, even when both nodes are requested
+        batch = list(dict.fromkeys(swe_ids))
+        rows = dict(zip(batch, _calc_all_planets(jd, batch, flags)))
+
+        # Normalize, derive the south node and flag retrogrades in one pass
+        lon: list[float] = []
+        lat: list[float] = []
+        speed: list[float] = []
+        retro: list[bool] = []
+        for obj_id_lower, swe_id in zip(requested, swe_ids):
+            row = rows[swe_id]
+            if obj_id_lower == "south_node":
+                # South Node is 180 degrees from North Node
+                lon.append(_opposite(row[0]))
+                lat.append(0.0)
+            else:
+                lon.append(row[0] % 360)
+                lat.append(row[1])
+            speed.append(row[3])
+            retro.append(row[3] < 0)
+
+        return PlanetArrays(
+            ids=tuple(requested),
+            lon=tuple(lon),
+            lat=tuple(lat),
+            speed=tuple(speed),
+            retro=tuple(retro),
+        )
 
     def _calc_houses(
         self,
@@ -278,24 +440,18 @@ class SwissEphemerisAdapter:
         cusps = result[0]
         ascmc = result[1]
 
-        # Extract house cusps
-        cusps_dict: dict[str, float] = {}
-        
-        if len(cusps) == 12:
-            # Whole Sign: cusps are indices 0-11 for houses 1-12
-            for i in range(12):
-                cusps_dict[str(i + 1)] = cusps[i] % 360
-        else:
-            # Placidus or other: indices 1-12 are houses 1-12
-            for i in range(1, 13):
-                if i < len(cusps):
-                    cusps_dict[str(i)] = cusps[i] % 360
+        # Extract house cusps: a 12-tuple holds houses 1-12 at indices 0-11,
+        # a longer (1-based) tuple holds them at indices 1-12
+        start = 0 if len(cusps) == 12 else 1
+        cusps_dict: dict[str, float] = dict(
+            zip(_HOUSE_KEYS, [cusp % 360 for cusp in cusps[start:start + 12]])
+        )
 
         # Extract angles
         asc = ascmc[0] % 360 if len(ascmc) > 0 else 0.0
         mc = ascmc[1] % 360 if len(ascmc) > 1 else 0.0
-        ic = (mc + 180) % 360
-        dc = (asc + 180) % 360
+        ic = _opposite(mc)
+        dc = _opposite(asc)
 
         return {
             "system": house_system_str,
@@ -309,31 +465,24 @@ class SwissEphemerisAdapter:
         }
 
     def _configure_flags(self, settings: EphemerisSettings) -> int:
-        """Prepare Swiss Ephemeris flags for the requested zodiac."""
-        flags = swe.FLG_SWIEPH
-        zodiac_type = settings.get("zodiac_type", "tropical")
-
-        if zodiac_type == "sidereal":
-            mode = self._resolve_ayanamsa(settings.get("ayanamsa"))
+        """Apply this adapter's Swiss Ephemeris state and prepare flags for the requested zodiac."""
+        self._ensure_ephe_path()
+        flags, mode = _flags_for(settings.get("zodiac_type", "tropical"), settings.get("ayanamsa"))
+        if mode != -1:
             self._ensure_sidereal_mode(mode)
-            flags |= swe.FLG_SIDEREAL
-
         return flags
 
-    def _resolve_ayanamsa(self, ayanamsa: Optional[str]) -> int:
-        """Map ayanamsa string to Swiss constant."""
-        if not ayanamsa:
-            return DEFAULT_AYANAMSA
-        ayanamsa_lower = ayanamsa.lower()
-        if ayanamsa_lower not in AYANAMSA_MAP:
-            valid_ayanamsas = list(AYANAMSA_MAP.keys())
-            raise InvalidAyanamsaError(ayanamsa, valid_ayanamsas)
-        return AYANAMSA_MAP[ayanamsa_lower]
+    def _ensure_ephe_path(self) -> None:
+        """Re-apply the ephemeris path if another adapter (or thread) changed it."""
+        if getattr(_swe_state, "ephe_path", None) == self.ephemeris_path:
+            return
+        swe.set_ephe_path(self.ephemeris_path)
+        _swe_state.ephe_path = self.ephemeris_path
 
     def _ensure_sidereal_mode(self, mode: int) -> None:
         """Cache sidereal mode configuration to avoid redundant calls."""
-        if self._current_sidereal_mode == mode:
+        if getattr(_swe_state, "sidereal_mode", None) == mode:
             return
         swe.set_sid_mode(mode, 0, 0)
-        self._current_sidereal_mode = mode
+        _swe_state.sidereal_mode = mode
 
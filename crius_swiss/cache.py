@@ -1,174 +1,28 @@
 """
 Caching layer for Swiss Ephemeris calculations.
 
-Provides LRU cache implementation for caching planet positions and house calculations.
+Provides a caching wrapper around SwissEphemerisAdapter, backed by the
+LRU EphemerisCache for planet positions and house calculations.
 """
 
+from collections import OrderedDict
 from typing import Optional, Dict, Tuple, Any
-from functools import lru_cache
 from datetime import datetime
 
 from crius_ephemeris_core import LayerPositions, EphemerisSettings, GeoLocation
 
+from .adapter import (
+    SWEPH_PLANET_IDS,
+    _datetime_to_jd,
+    _flags_for,
+    _get_house_system_bytes,
+    _opposite,
+)
+from .ephemeris_cache import EphemerisCache
 
-class EphemerisCache:
-    """
-    LRU cache for ephemeris calculations.
-
-    Caches planet positions and house calculations to improve performance
-    for repeated calculations.
-    """
-
-    def __init__(self, maxsize: int = 128):
-        """
-        Initialize cache.
-
-        Args:
-            maxsize: Maximum number of cached entries (default: 128)
-        """
-        self.maxsize = maxsize
-        self._planet_cache: Dict[Tuple[float, str, int], Dict[str, Any]] = {}
-        self._house_cache: Dict[Tuple[float, float, float, bytes, int], Dict[str, Any]] = {}
-        self._hits = 0
-        self._misses = 0
-
-    def _get_planet_key(self, jd: float, planet_id: str, flags: int) -> Tuple[float, str, int]:
-        """Generate cache key for planet position."""
-        # Round JD to nearest minute for caching (reduces cache size)
-        jd_rounded = round(jd * 1440) / 1440  # Round to nearest minute
-        return (jd_rounded, planet_id, flags)
-
-    def _get_house_key(
-        self, jd: float, lat: float, lon: float, house_system_bytes: bytes, flags: int
-    ) -> Tuple[float, float, float, bytes, int]:
-        """Generate cache key for house calculation."""
-        # Round JD to nearest minute
-        jd_rounded = round(jd * 1440) / 1440
-        # Round coordinates to 4 decimal places (about 11 meters precision)
-        lat_rounded = round(lat * 10000) / 10000
-        lon_rounded = round(lon * 10000) / 10000
-        return (jd_rounded, lat_rounded, lon_rounded, house_system_bytes, flags)
 
-    def get_planet_position(
-        self, jd: float, planet_id: str, flags: int
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Get cached planet position.
-
-        Args:
-            jd: Julian Day
-            planet_id: Planet ID
-            flags: Calculation flags
-
-        Returns:
-            Cached position or None if not found
-        """
-        key = self._get_planet_key(jd, planet_id, flags)
-        if key in self._planet_cache:
-            self._hits += 1
-            return self._planet_cache[key]
-        self._misses += 1
-        return None
-
-    def set_planet_position(
-        self, jd: float, planet_id: str, flags: int, position: Dict[str, Any]
-    ) -> None:
-        """
-        Cache planet position.
-
-        Args:
-            jd: Julian Day
-            planet_id: Planet ID
-            flags: Calculation flags
-            position: Planet position to cache
-        """
-        key = self._get_planet_key(jd, planet_id, flags)
-        
-        # Evict oldest entries if cache is full
-        if len(self._planet_cache) >= self.maxsize:
-            # Remove oldest entry (simple FIFO, could be improved with LRU)
-            oldest_key = next(iter(self._planet_cache))
-            del self._planet_cache[oldest_key]
-        
-        self._planet_cache[key] = position
-
-    def get_house_positions(
-        self, jd: float, lat: float, lon: float, house_system_bytes: bytes, flags: int
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Get cached house positions.
-
-        Args:
-            jd: Julian Day
-            lat: Latitude
-            lon: Longitude
-            house_system_bytes: House system bytes
-            flags: Calculation flags
-
-        Returns:
-            Cached house positions or None if not found
-        """
-        key = self._get_house_key(jd, lat, lon, house_system_bytes, flags)
-        if key in self._house_cache:
-            self._hits += 1
-            return self._house_cache[key]
-        self._misses += 1
-        return None
-
-    def set_house_positions(
-        self,
-        jd: float,
-        lat: float,
-        lon: float,
-        house_system_bytes: bytes,
-        flags: int,
-        houses: Dict[str, Any],
-    ) -> None:
-        """
-        Cache house positions.
-
-        Args:
-            jd: Julian Day
-            lat: Latitude
-            lon: Longitude
-            house_system_bytes: House system bytes
-            flags: Calculation flags
-            houses: House positions to cache
-        """
-        key = self._get_house_key(jd, lat, lon, house_system_bytes, flags)
-        
-        # Evict oldest entries if cache is full
-        if len(self._house_cache) >= self.maxsize:
-            oldest_key = next(iter(self._house_cache))
-            del self._house_cache[oldest_key]
-        
-        self._house_cache[key] = houses
-
-    def clear(self) -> None:
-        """Clear all cached entries."""
-        self._planet_cache.clear()
-        self._house_cache.clear()
-        self._hits = 0
-        self._misses = 0
-
-    def get_stats(self) -> Dict[str, Any]:
-        """
-        Get cache statistics.
-
-        Returns:
-            Dictionary with cache statistics
-        """
-        total_requests = self._hits + self._misses
-        hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
-        
-        return {
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": hit_rate,
-            "planet_cache_size": len(self._planet_cache),
-            "house_cache_size": len(self._house_cache),
-            "maxsize": self.maxsize,
-        }
+# SwissEphemerisAdapter methods used for per-planet and per-house caching
+_PER_OBJECT_METHODS = ("_configure_flags", "_calc_planet_arrays", "_calc_houses")
 
 
 class CachedSwissEphemerisAdapter:
@@ -179,21 +33,35 @@ class CachedSwissEphemerisAdapter:
     For more control, you can use the cache directly with the adapter.
     """
 
+    __slots__ = (
+        "adapter",
+        "cache",
+        "_layer_cache",
+        "_layer_hits",
+        "_layer_misses",
+        "_per_object",
+    )
+
     def __init__(self, adapter, cache: Optional[EphemerisCache] = None):
         """
         Initialize cached adapter.
 
         Args:
-            adapter: SwissEphemerisAdapter instance
+            adapter: SwissEphemerisAdapter instance (or compatible object).
+                     Objects providing only calc_positions get whole-request
+                     caching but no per-planet or per-house caching.
             cache: Optional EphemerisCache instance (creates default if None)
         """
-        from .adapter import SwissEphemerisAdapter
-        
-        if not isinstance(adapter, SwissEphemerisAdapter):
-            raise TypeError("adapter must be a SwissEphemerisAdapter instance")
+        if not hasattr(adapter, "calc_positions"):
+            raise TypeError("adapter must provide calc_positions (e.g. SwissEphemerisAdapter)")
         
         self.adapter = adapter
+        # Per-planet and per-house caching calls into SwissEphemerisAdapter internals
+        self._per_object = all(hasattr(adapter, name) for name in _PER_OBJECT_METHODS)
         self.cache = cache or EphemerisCache()
+        self._layer_cache: OrderedDict[Tuple[Any, ...], LayerPositions] = OrderedDict()
+        self._layer_hits = 0
+        self._layer_misses = 0
 
     def calc_positions(
         self,
@@ -204,63 +72,104 @@ class CachedSwissEphemerisAdapter:
         """
         Calculate positions with caching.
 
-        Uses cache for planet positions and house calculations.
+        Repeated requests are served whole from a layer cache; otherwise
+        uses cache for planet positions and house calculations.
+
+        The returned dicts are shared with the cache and must not be modified.
         """
-        from .adapter import _datetime_to_jd, _get_house_system_bytes
-        
         jd = _datetime_to_jd(dt_utc)
-        house_system_bytes = _get_house_system_bytes(settings["house_system"])
-        flags = self.adapter._configure_flags(settings)
+        flags, sidereal_mode = _flags_for(
+            settings.get("zodiac_type", "tropical"), settings.get("ayanamsa")
+        )
+        include_objects = settings.get("include_objects", [])
 
-        # Calculate planets with caching
-        planets: dict[str, Any] = {}
+        # Same rounding as the planet and house cache keys
+        layer_key = (
+            round(jd * 1440),
+            round(location["lat"] * 10000) if location else None,
+            round(location["lon"] * 10000) if location else None,
+            tuple(include_objects),
+            settings["house_system"],
+            flags,
+            sidereal_mode,
+        )
+        layer = self._layer_cache.get(layer_key)
+        if layer is not None:
+            self._layer_cache.move_to_end(layer_key)
+            self._layer_hits += 1
+            return layer
+        self._layer_misses += 1
+
+        if self._per_object:
+            layer = self._calc_layer(jd, location, settings, sidereal_mode)
+        else:
+            layer = self.adapter.calc_positions(dt_utc, location, settings)
+
+        # Evict least recently used entry if layer cache is full
+        self._layer_cache[layer_key] = layer
+        if len(self._layer_cache) > self.cache.maxsize:
+            self._layer_cache.popitem(last=False)
+        return layer
+
+    def _calc_layer(
+        self,
+        jd: float,
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+        sidereal_mode: int,
+    ) -> LayerPositions:
+        """Calculate a layer, using the planet and house caches."""
+        flags = self.adapter._configure_flags(settings)
         include_objects = settings.get("include_objects", [])
+        house_system_bytes = _get_house_system_bytes(settings["house_system"])
 
+        # Pair each requested object with the body it is computed from
+        # (the south node is derived from the north node)
+        requested: list[Tuple[str, str]] = []
         for obj_id in include_objects:
             obj_id_lower = obj_id.lower()
-
-            # Handle special cases (south node, etc.)
-            if obj_id_lower == "south_node":
-                # Check cache for north node
-                north_node_pos = self.cache.get_planet_position(jd, "north_node", flags)
-                if north_node_pos is None:
-                    # Calculate north node
-                    north_node_pos = self.adapter._calc_planet_position("north_node", jd, flags)
-                    if north_node_pos:
-                        self.cache.set_planet_position(jd, "north_node", flags, north_node_pos)
-                
-                if north_node_pos:
-                    south_lon = (north_node_pos["lon"] + 180) % 360
-                    planets["south_node"] = {
-                        "lon": south_lon,
-                        "lat": 0.0,
-                        "speed_lon": north_node_pos["speed_lon"],
-                        "retrograde": north_node_pos["retrograde"],
-                    }
+            body = "north_node" if obj_id_lower == "south_node" else obj_id_lower
+            if body in SWEPH_PLANET_IDS:
+                requested.append((obj_id_lower, body))
+
+        # Serve bodies from the cache where possible
+        positions: dict[str, Any] = {}
+        missing: list[str] = []
+        for _, body in requested:
+            if body in positions or body in missing:
                 continue
+            cached_pos = self.cache.get_planet_position(jd, body, flags, sidereal_mode)
+            if cached_pos is None:
+                missing.append(body)
+            else:
+                positions[body] = cached_pos
 
-            # Import here to avoid circular dependency
-            from .adapter import SWEPH_PLANET_IDS
-            if obj_id_lower not in SWEPH_PLANET_IDS:
-                continue
+        # Calculate all cache misses in one batch and cache them
+        if missing:
+            arrays = self.adapter._calc_planet_arrays(jd, missing, flags)
+            for body, lon, lat, speed, retro in zip(*arrays):
+                planet_pos = {"lon": lon, "lat": lat, "speed_lon": speed, "retrograde": retro}
+                self.cache.set_planet_position(jd, body, flags, planet_pos, sidereal_mode)
+                positions[body] = planet_pos
 
-            # Check cache
-            cached_pos = self.cache.get_planet_position(jd, obj_id_lower, flags)
-            if cached_pos is not None:
-                planets[obj_id_lower] = cached_pos
-            else:
-                # Calculate and cache
-                # Access the method through the adapter
-                planet_pos = self.adapter._calc_planet_position(obj_id_lower, jd, flags)
-                if planet_pos:
-                    self.cache.set_planet_position(jd, obj_id_lower, flags, planet_pos)
-                    planets[obj_id_lower] = planet_pos
+        planets: dict[str, Any] = {}
+        for obj_id_lower, body in requested:
+            planet_pos = positions[body]
+            if obj_id_lower == "south_node":
+                # South Node is 180 degrees from North Node
+                planet_pos = {
+                    "lon": _opposite(planet_pos["lon"]),
+                    "lat": 0.0,
+                    "speed_lon": planet_pos["speed_lon"],
+                    "retrograde": planet_pos["retrograde"],
+                }
+            planets[obj_id_lower] = planet_pos
 
         # Calculate houses with caching
         houses: Optional[dict[str, Any]] = None
         if location:
             cached_houses = self.cache.get_house_positions(
-                jd, location["lat"], location["lon"], house_system_bytes, flags
+                jd, location["lat"], location["lon"], house_system_bytes, flags, sidereal_mode
             )
             if cached_houses is not None:
                 houses = cached_houses
@@ -275,7 +184,13 @@ class CachedSwissEphemerisAdapter:
                     flags,
                 )
                 self.cache.set_house_positions(
-                    jd, location["lat"], location["lon"], house_system_bytes, flags, houses
+                    jd,
+                    location["lat"],
+                    location["lon"],
+                    house_system_bytes,
+                    flags,
+                    houses,
+                    sidereal_mode,
                 )
 
         return {
@@ -286,8 +201,24 @@ class CachedSwissEphemerisAdapter:
     def clear_cache(self) -> None:
         """Clear the cache."""
         self.cache.clear()
+        self._layer_cache.clear()
+        self._layer_hits = 0
+        self._layer_misses = 0
 
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        return self.cache.get_stats()
+        """
+        Get cache statistics.
+
+        A request served whole from the layer cache counts as one hit; other
+        requests count their planet and house lookups as before.
+        """
+        stats = self.cache.get_stats()
+        hits = stats["hits"] + self._layer_hits
+        total_requests = hits + stats["misses"]
+        stats["hits"] = hits
+        stats["hit_rate"] = hits / total_requests if total_requests > 0 else 0.0
+        stats["layer_hits"] = self._layer_hits
+        stats["layer_misses"] = self._layer_misses
+        stats["layer_cache_size"] = len(self._layer_cache)
+        return stats
 
@@ -0,0 +1,208 @@
+"""
+LRU cache for Swiss Ephemeris planet positions and house calculations.
+
+Kept apart from the cached adapter so importing EphemerisCache does not
+load swisseph.
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple, Any
+
+
+class EphemerisCache:
+    """
+    LRU cache for ephemeris calculations.
+
+    Caches planet positions and house calculations to improve performance
+    for repeated calculations.
+    """
+
+    __slots__ = ("maxsize", "_planet_cache", "_house_cache", "_hits", "_misses")
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached entries (default: 128)
+        """
+        self.maxsize = maxsize
+        self._planet_cache: OrderedDict[Tuple[int, str, int, int], Dict[str, Any]] = (
+            OrderedDict()
+        )
+        self._house_cache: OrderedDict[Tuple[int, int, int, bytes, int, int], Dict[str, Any]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def _get_planet_key(
+        self, jd: float, planet_id: str, flags: int, sidereal_mode: int
+    ) -> Tuple[int, str, int, int]:
+        """Generate cache key for planet position."""
+        # Key on the integer Julian minute (reduces cache size, hashes as int);
+        # all ayanamsas share the same flags, so the sidereal mode is keyed too
+        return (round(jd * 1440), planet_id, flags, sidereal_mode)
+
+    def _get_house_key(
+        self,
+        jd: float,
+        lat: float,
+        lon: float,
+        house_system_bytes: bytes,
+        flags: int,
+        sidereal_mode: int,
+    ) -> Tuple[int, int, int, bytes, int, int]:
+        """Generate cache key for house calculation."""
+        # Integer Julian minute, and coordinates in units of 1e-4 degrees
+        # (about 11 meters precision)
+        return (
+            round(jd * 1440),
+            round(lat * 10000),
+            round(lon * 10000),
+            house_system_bytes,
+            flags,
+            sidereal_mode,
+        )
+
+    def get_planet_position(
+        self, jd: float, planet_id: str, flags: int, sidereal_mode: int = -1
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached planet position.
+
+        Args:
+            jd: Julian Day
+            planet_id: Planet ID
+            flags: Calculation flags
+            sidereal_mode: Swiss Ephemeris sidereal mode (-1 for tropical)
+
+        Returns:
+            Cached position or None if not found
+        """
+        key = self._get_planet_key(jd, planet_id, flags, sidereal_mode)
+        position = self._planet_cache.get(key)
+        if position is None:
+            self._misses += 1
+        else:
+            self._planet_cache.move_to_end(key)
+            self._hits += 1
+        return position
+
+    def set_planet_position(
+        self,
+        jd: float,
+        planet_id: str,
+        flags: int,
+        position: Dict[str, Any],
+        sidereal_mode: int = -1,
+    ) -> None:
+        """
+        Cache planet position.
+
+        Args:
+            jd: Julian Day
+            planet_id: Planet ID
+            flags: Calculation flags
+            position: Planet position to cache
+            sidereal_mode: Swiss Ephemeris sidereal mode (-1 for tropical)
+        """
+        # Intern the ID so later key comparisons can short-circuit on identity
+        key = self._get_planet_key(jd, sys.intern(planet_id), flags, sidereal_mode)
+        
+        self._planet_cache[key] = position
+        self._planet_cache.move_to_end(key)
+        
+        # Evict least recently used entry if cache is full
+        if len(self._planet_cache) > self.maxsize:
+            self._planet_cache.popitem(last=False)
+
+    def get_house_positions(
+        self,
+        jd: float,
+        lat: float,
+        lon: float,
+        house_system_bytes: bytes,
+        flags: int,
+        sidereal_mode: int = -1,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached house positions.
+
+        Args:
+            jd: Julian Day
+            lat: Latitude
+            lon: Longitude
+            house_system_bytes: House system bytes
+            flags: Calculation flags
+            sidereal_mode: Swiss Ephemeris sidereal mode (-1 for tropical)
+
+        Returns:
+            Cached house positions or None if not found
+        """
+        key = self._get_house_key(jd, lat, lon, house_system_bytes, flags, sidereal_mode)
+        houses = self._house_cache.get(key)
+        if houses is None:
+            self._misses += 1
+        else:
+            self._house_cache.move_to_end(key)
+            self._hits += 1
+        return houses
+
+    def set_house_positions(
+        self,
+        jd: float,
+        lat: float,
+        lon: float,
+        house_system_bytes: bytes,
+        flags: int,
+        houses: Dict[str, Any],
+        sidereal_mode: int = -1,
+    ) -> None:
+        """
+        Cache house positions.
+
+        Args:
+            jd: Julian Day
+            lat: Latitude
+            lon: Longitude
+            house_system_bytes: House system bytes
+            flags: Calculation flags
+            houses: House positions to cache
+            sidereal_mode: Swiss Ephemeris sidereal mode (-1 for tropical)
+        """
+        key = self._get_house_key(jd, lat, lon, house_system_bytes, flags, sidereal_mode)
+        
+        self._house_cache[key] = houses
+        self._house_cache.move_to_end(key)
+        
+        # Evict least recently used entry if cache is full
+        if len(self._house_cache) > self.maxsize:
+            self._house_cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        self._planet_cache.clear()
+        self._house_cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        total_requests = self._hits + self._misses
+        hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+        
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": hit_rate,
+            "planet_cache_size": len(self._planet_cache),
+            "house_cache_size": len(self._house_cache),
+            "maxsize": self.maxsize,
+        }
@@ -19,19 +19,25 @@ class EphemerisFileNotFoundError(CriusSwissError):
             message: Optional custom message
         """
         self.path = path
-        if message is None:
-            message = (
-                f"Swiss Ephemeris data files not found at: {path}\n"
-                f"Please ensure Swiss Ephemeris data files (.se1 files) are installed.\n"
-                f"You can:\n"
-                f"  1. Set SWISS_EPHEMERIS_PATH environment variable to the correct path\n"
-                f"  2. Install Swiss Ephemeris files to {path}\n"
-                f"  3. Pass ephemeris_path parameter to SwissEphemerisAdapter\n"
-                f"\n"
-                f"For licensing and download information, see:\n"
-                f"  https://www.astro.com/swisseph/swephinfo_e.htm"
-            )
-        super().__init__(message)
+        self.message = message
+        super().__init__(path, message)
+
+    def __str__(self) -> str:
+        """Return the custom message, or build the default one on demand."""
+        if self.message is not None:
+            return self.message
+        path = self.path
+        return "\n".join((
+            f"Swiss Ephemeris data files not found at: {path}",
+            "Please ensure Swiss Ephemeris data files (.se1 files) are installed.",
+            "You can:",
+            "  1. Set SWISS_EPHEMERIS_PATH environment variable to the correct path",
+            f"  2. Install Swiss Ephemeris files to {path}",
+            "  3. Pass ephemeris_path parameter to SwissEphemerisAdapter",
+            "",
+            "For licensing and download information, see:",
+            "  https://www.astro.com/swisseph/swephinfo_e.htm",
+        ))
 
 
 class EphemerisCalculationError(CriusSwissError):
@@ -48,11 +54,12 @@ class EphemerisCalculationError(CriusSwissError):
         """
         self.planet_id = planet_id
         self.datetime = datetime
-        full_message = message
-        if planet_id:
-            full_message += f" (planet: {planet_id})"
-        if datetime:
-            full_message += f" (datetime: {datetime})"
+        # Adjacent f-strings compile to a single string build
+        full_message = (
+            f"{message}"
+            f"{f' (planet: {planet_id})' if planet_id else ''}"
+            f"{f' (datetime: {datetime})' if datetime else ''}"
+        )
         super().__init__(full_message)
 
 
@@ -5,13 +5,86 @@ Provides functions to validate Swiss Ephemeris data file presence and integrity.
 """
 
 import os
+import stat
 from pathlib import Path
-from typing import List, Tuple
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .exceptions import EphemerisFileNotFoundError
 
+# Swiss Ephemeris data file suffix; a slice compare skips the endswith() call
+_SE1 = '.se1'
+_SE1_START = -len(_SE1)
 
-def validate_ephemeris_path(path: str) -> Tuple[bool, List[str]]:
+# Main planet, Moon and asteroid files of the standard 600-year range
+# (1800-2399 AD); pass as required_files to check a standard installation
+DEFAULT_REQUIRED_FILES: FrozenSet[str] = frozenset({"sepl_18.se1", "semo_18.se1", "seas_18.se1"})
+
+# Shared (immutable) error list for successful validations
+_NO_ERRORS: Tuple[str, ...] = ()
+
+# Accepted path arguments; normalized to str once on entry
+_PathLike = Union[str, "os.PathLike[str]"]
+
+
+@lru_cache(maxsize=32)
+def _scan_dir_cached(
+    path: str, dev: int, ino: int, mtime_ns: int
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    List entry names in a directory, cached per directory identity and mtime.
+
+    Adding, removing or renaming an entry updates the directory's mtime, so
+    passing the current ``st_mtime_ns`` makes a stale listing unreachable.
+    The absolute path, device and inode tell apart directories that share an
+    mtime, e.g. a relative path after a chdir, or a directory recreated with
+    its mtime preserved (tar -x, rsync -t, cp -p).
+
+    Returns:
+        Tuple of (all entry names, names ending in .se1)
+    """
+    names = os.listdir(path)
+    return frozenset(names), frozenset(name for name in names if name[_SE1_START:] == _SE1)
+
+
+def _scan_dir(path: str, st: os.stat_result) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """List a directory already stat'ed by _stat_directory, via the listing cache."""
+    return _scan_dir_cached(os.path.abspath(path), st.st_dev, st.st_ino, st.st_mtime_ns)
+
+
+def _stat_directory(path: str) -> Union[os.stat_result, str]:
+    """
+    Stat a path that should be a directory, with a single system call.
+
+    Returns:
+        The stat result for a directory, or an error message
+    """
+    if not path:
+        return "Path is empty"
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Same outcome os.path.exists reports as "does not exist"
+        return f"Path does not exist: {path}"
+    
+    if not stat.S_ISDIR(st.st_mode):
+        return f"Path is not a directory: {path}"
+    
+    return st
+
+
+def validate_ephemeris_path(path: _PathLike) -> Tuple[bool, Sequence[str]]:
     """
     Validate that ephemeris path exists and contains expected files.
 
@@ -19,72 +92,88 @@ def validate_ephemeris_path(path: str) -> Tuple[bool, List[str]]:
         path: Path to check
 
     Returns:
-        Tuple of (is_valid, list_of_errors)
+        Tuple of (is_valid, errors); errors is empty when valid
     """
-    errors: List[str] = []
-    
-    if not path:
-        errors.append("Path is empty")
-        return False, errors
-    
-    if not os.path.exists(path):
-        errors.append(f"Path does not exist: {path}")
-        return False, errors
+    path = os.fspath(path) if path else ""
     
-    if not os.path.isdir(path):
-        errors.append(f"Path is not a directory: {path}")
-        return False, errors
+    st = _stat_directory(path)
+    if isinstance(st, str):
+        return False, [st]
     
     # Check for .se1 files (Swiss Ephemeris data files)
-    se1_files = [f for f in os.listdir(path) if f.endswith('.se1')]
-    if not se1_files:
-        errors.append(f"No .se1 files found in: {path}")
-        return False, errors
+    _, se1_names = _scan_dir(path, st)
+    if se1_names:
+        return True, _NO_ERRORS
     
-    return True, []
+    return False, [f"No .se1 files found in: {path}"]
 
 
-def validate_ephemeris_files(path: str, required_files: List[str] = None) -> Tuple[bool, List[str]]:
+def validate_ephemeris_files(
+    path: _PathLike, required_files: Optional[Iterable[str]] = None
+) -> Tuple[bool, Sequence[str]]:
     """
     Validate that required ephemeris files are present.
 
     Args:
         path: Path to ephemeris directory
-        required_files: Optional list of required file names.
+        required_files: Optional required file names, e.g. DEFAULT_REQUIRED_FILES.
                        If None, checks for at least one .se1 file.
 
     Returns:
-        Tuple of (is_valid, list_of_errors)
+        Tuple of (is_valid, errors); errors is empty when valid
     """
-    errors: List[str] = []
+    path = os.fspath(path) if path else ""
     
     # First validate path exists
-    is_valid, path_errors = validate_ephemeris_path(path)
-    if not is_valid:
-        return False, path_errors
+    st = _stat_directory(path)
+    if isinstance(st, str):
+        return False, [st]
+    
+    # Read the directory (at most) once; every check below is a set lookup
+    present, se1_names = _scan_dir(path, st)
+    
+    if not se1_names:
+        return False, [f"No .se1 files found in: {path}"]
     
     if required_files is None:
-        # Just check for at least one .se1 file
-        se1_files = [f for f in os.listdir(path) if f.endswith('.se1')]
-        if not se1_files:
-            errors.append(f"No .se1 files found in: {path}")
-        return len(errors) == 0, errors
-    
-    # Check for specific required files
-    missing_files = []
-    for filename in required_files:
-        filepath = os.path.join(path, filename)
-        if not os.path.exists(filepath):
-            missing_files.append(filename)
+        return True, _NO_ERRORS
+    
+    if isinstance(required_files, AbstractSet):
+        # One set difference; sorted since sets have no meaningful order
+        not_listed = sorted(required_files - present)
+    else:
+        not_listed = [filename for filename in required_files if filename not in present]
     
+    # Names missing from the listing may still exist, e.g. in a subdirectory
+    # (ast136/s136108s.se1) or in another case on case-insensitive filesystems
+    missing_files = [
+        filename for filename in not_listed if not os.path.exists(os.path.join(path, filename))
+    ]
     if missing_files:
-        errors.append(f"Missing required files: {', '.join(missing_files)}")
-        errors.append(f"Expected in: {path}")
+        return False, [
+            f"Missing required files: {', '.join(missing_files)}",
+            f"Expected in: {path}",
+        ]
     
-    return len(errors) == 0, errors
+    return True, _NO_ERRORS
 
 
-def check_file_integrity(filepath: str) -> Tuple[bool, List[str]]:
+def _check_file_stat(filepath: str, st: os.stat_result) -> Tuple[bool, Sequence[str]]:
+    """Check file type and size from an existing stat result."""
+    if not stat.S_ISREG(st.st_mode):
+        return False, [f"Path is not a file: {filepath}"]
+    
+    # Check file size (Swiss Ephemeris files are typically > 1MB)
+    file_size = st.st_size
+    if file_size == 0:
+        return False, [f"File is empty: {filepath}"]
+    if file_size < 1024:  # Less than 1KB is suspicious
+        return False, [f"File is unusually small ({file_size} bytes): {filepath}"]
+    
+    return True, _NO_ERRORS
+
+
+def check_file_integrity(filepath: _PathLike) -> Tuple[bool, Sequence[str]]:
     """
     Perform basic integrity checks on an ephemeris file.
 
@@ -92,47 +181,78 @@ def check_file_integrity(filepath: str) -> Tuple[bool, List[str]]:
         filepath: Path to file to check
 
     Returns:
-        Tuple of (is_valid, list_of_errors)
+        Tuple of (is_valid, errors); errors is empty when valid
     """
-    errors: List[str] = []
+    filepath = os.fspath(filepath) if filepath else ""
     
-    if not os.path.exists(filepath):
-        errors.append(f"File does not exist: {filepath}")
-        return False, errors
+    # One stat() provides existence, file type and size
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return False, [f"File does not exist: {filepath}"]
     
-    if not os.path.isfile(filepath):
-        errors.append(f"Path is not a file: {filepath}")
-        return False, errors
+    return _check_file_stat(filepath, st)
+
+
+def check_file_integrity_entry(entry: "os.DirEntry[str]") -> Tuple[bool, Sequence[str]]:
+    """
+    Perform basic integrity checks on a file found with os.scandir().
+
+    Same checks as check_file_integrity, but uses the entry's stat result,
+    which is cached on the entry (and on Windows comes free with the listing).
+
+    Args:
+        entry: Directory entry of the file to check
+
+    Returns:
+        Tuple of (is_valid, errors); errors is empty when valid
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        return False, [f"File does not exist: {entry.path}"]
     
-    # Check file size (Swiss Ephemeris files are typically > 1MB)
-    file_size = os.path.getsize(filepath)
-    if file_size == 0:
-        errors.append(f"File is empty: {filepath}")
-    elif file_size < 1024:  # Less than 1KB is suspicious
-        errors.append(f"File is unusually small ({file_size} bytes): {filepath}")
+    return _check_file_stat(entry.path, st)
+
+
+def iter_ephemeris_files(path: _PathLike) -> Iterator["os.DirEntry[str]"]:
+    """
+    Iterate over Swiss Ephemeris data files in a directory, in directory order.
+
+    Entries are yielded as they are read, so callers that only need the
+    first match can stop early. Pass them to check_file_integrity_entry to
+    reuse their stat result.
+
+    Args:
+        path: Path to search
+
+    Yields:
+        Directory entries of .se1 files
+    """
+    path = os.fspath(path) if path else ""
+    if isinstance(_stat_directory(path), str):
+        return
     
-    return len(errors) == 0, errors
+    # DirEntry.is_file() uses the type reported by readdir, so regular
+    # files need no extra stat() call
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name[_SE1_START:] == _SE1 and entry.is_file():
+                yield entry
 
 
-def find_ephemeris_files(path: str) -> List[str]:
+def find_ephemeris_files(path: _PathLike, sort: bool = True) -> List[str]:
     """
     Find all Swiss Ephemeris data files in a directory.
 
     Args:
         path: Path to search
+        sort: Sort the result; pass False if order does not matter
 
     Returns:
         List of file paths
     """
-    if not os.path.exists(path) or not os.path.isdir(path):
-        return []
-    
-    se1_files = []
-    for filename in os.listdir(path):
-        if filename.endswith('.se1'):
-            filepath = os.path.join(path, filename)
-            if os.path.isfile(filepath):
-                se1_files.append(filepath)
-    
-    return sorted(se1_files)
-
+    se1_files = [entry.path for entry in iter_ephemeris_files(path)]
+    if sort:
+        se1_files.sort()
+    return se1_files
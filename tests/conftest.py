@@ -20,7 +20,7 @@ def sample_settings() -> EphemerisSettings:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_location() -> GeoLocation:
     """Sample geographic location (New York)."""
     return {
@@ -29,41 +29,40 @@ def sample_location() -> GeoLocation:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_datetime() -> datetime:
     """Sample datetime for testing."""
     return datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
 
-@pytest.fixture
-def ephemeris_path(monkeypatch, tmp_path):
+@pytest.fixture(scope="session")
+def ephemeris_path(tmp_path_factory):
     """Fixture for ephemeris path configuration."""
     # Try to use environment variable or default
     default_path = os.getenv("SWISS_EPHEMERIS_PATH", "/usr/local/share/swisseph")
     
-    # If default path exists, use it; otherwise use tmp_path
+    # If default path exists, use it; otherwise use a temporary directory
     if os.path.exists(default_path):
         return default_path
     
-    # Create a temporary directory structure
-    test_path = tmp_path / "swisseph"
-    test_path.mkdir(parents=True, exist_ok=True)
-    
-    # Set environment variable for tests
-    monkeypatch.setenv("SWISS_EPHEMERIS_PATH", str(test_path))
-    
-    return str(test_path)
+    return os.fspath(tmp_path_factory.mktemp("swisseph"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def adapter(ephemeris_path):
-    """Create adapter instance for testing."""
+    """
+    Create one adapter instance shared by the whole test session.
+
+    The adapter re-applies its ephemeris path and sidereal mode whenever
+    another adapter has changed them, so sharing it is safe. Tests that
+    need a fresh adapter should construct their own.
+    """
     # Note: This will fail if Swiss Ephemeris files are not available
     # Tests should be marked appropriately
     try:
         return SwissEphemerisAdapter(ephemeris_path=ephemeris_path)
     except Exception:
-        # If adapter creation fails, return None and let tests handle it
+        # If adapter creation fails, skip every test that needs it
         pytest.skip("Swiss Ephemeris files not available")
 
 
@@ -76,7 +75,7 @@ def adapter_with_default_path():
         pytest.skip("Swiss Ephemeris files not available")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_planets_settings() -> EphemerisSettings:
     """Settings including all supported planets."""
     return {
@@ -35,63 +35,64 @@ class TestAdapterInitialization:
         assert adapter.ephemeris_path == test_path
 
 
+@pytest.fixture(scope="module")
+def planet_settings(all_planets_settings) -> EphemerisSettings:
+    """
+    Settings with every supported planet except Chiron.
+
+    Chiron needs the asteroid file (seas_18.se1); leaving it out keeps the
+    tests using these settings independent of that file.
+    """
+    return {
+        **all_planets_settings,
+        "include_objects": [
+            obj for obj in all_planets_settings["include_objects"] if obj != "chiron"
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def planet_positions(adapter, planet_settings, sample_location, sample_datetime):
+    """Positions for planet_settings, calculated once for this module."""
+    return adapter.calc_positions(sample_datetime, sample_location, planet_settings)
+
+
 class TestPlanetCalculations:
     """Test planet position calculations."""
 
-    def test_calc_sun_position(self, adapter, sample_settings, sample_location):
+    def test_calc_sun_position(self, planet_positions):
         """Test calculating Sun position."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
-        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        positions = adapter.calc_positions(dt, sample_location, sample_settings)
-        
-        assert "planets" in positions
-        assert "sun" in positions["planets"]
-        
-        sun = positions["planets"]["sun"]
-        assert "lon" in sun
-        assert "lat" in sun
-        assert "speed_lon" in sun
-        assert "retrograde" in sun
+        sun = planet_positions["planets"]["sun"]
+        assert {"lon", "lat", "speed_lon", "retrograde"} <= sun.keys()
         assert 0 <= sun["lon"] < 360
 
-    def test_calc_moon_position(self, adapter, sample_settings, sample_location):
+    def test_calc_moon_position(self, planet_positions):
         """Test calculating Moon position."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
-        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        positions = adapter.calc_positions(dt, sample_location, sample_settings)
-        
-        assert "moon" in positions["planets"]
-        moon = positions["planets"]["moon"]
+        moon = planet_positions["planets"]["moon"]
         assert 0 <= moon["lon"] < 360
 
-    def test_calc_all_planets(self, adapter, all_planets_settings, sample_location):
+    def test_calc_all_planets(
+        self, adapter, all_planets_settings, sample_location, sample_datetime
+    ):
         """Test calculating all supported planets."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
+        positions = adapter.calc_positions(sample_datetime, sample_location, all_planets_settings)
         
-        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        positions = adapter.calc_positions(dt, sample_location, all_planets_settings)
-        
-        expected_planets = [
-            "sun", "moon", "mercury", "venus", "mars",
-            "jupiter", "saturn", "uranus", "neptune", "pluto",
-            "chiron", "north_node", "south_node",
-        ]
-        
-        for planet in expected_planets:
+        for planet in all_planets_settings["include_objects"]:
             assert planet in positions["planets"], f"Missing planet: {planet}"
             pos = positions["planets"][planet]
             assert 0 <= pos["lon"] < 360, f"Invalid longitude for {planet}"
 
+    def test_speeds_and_retrograde(self, planet_positions):
+        """Test speeds are calculated, so retrograde motion is detected."""
+        planets = planet_positions["planets"]
+        assert planets["sun"]["speed_lon"] > 0
+        assert not planets["sun"]["retrograde"]
+        # The lunar node moves backwards through the zodiac
+        assert planets["north_node"]["speed_lon"] < 0
+        assert planets["north_node"]["retrograde"]
+
     def test_calc_chiron(self, adapter, sample_location):
         """Test calculating Chiron position."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             "zodiac_type": "tropical",
             "ayanamsa": None,
@@ -108,9 +109,6 @@ class TestPlanetCalculations:
 
     def test_calc_lunar_nodes(self, adapter, sample_location):
         """Test calculating lunar nodes."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             "zodiac_type": "tropical",
             "ayanamsa": None,
@@ -131,15 +129,37 @@ class TestPlanetCalculations:
         diff = abs((south["lon"] - north["lon"]) % 360)
         assert diff < 1.0 or diff > 359.0
 
+    def test_calc_planet_arrays(self, adapter, planet_settings, planet_positions, sample_datetime):
+        """Test column output matches calc_positions."""
+        arrays = adapter.calc_planet_arrays(sample_datetime, planet_settings)
+        positions = planet_positions
+        
+        assert list(arrays.ids) == list(positions["planets"])
+        assert len(arrays.lon) == len(arrays.lat) == len(arrays.speed) == len(arrays.retro)
+        for i, planet in enumerate(arrays.ids):
+            pos = positions["planets"][planet]
+            assert arrays.lon[i] == pos["lon"]
+            assert arrays.speed[i] == pos["speed_lon"]
+            assert arrays.retro[i] == pos["retrograde"]
+
+    def test_calc_positions_batch(self, adapter, sample_settings, sample_location):
+        """Test batch results match individual calculations."""
+        dts = [
+            datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            datetime(2024, 6, 15, 18, 30, 0, tzinfo=timezone.utc),
+        ]
+        results = adapter.calc_positions_batch(dts, sample_location, sample_settings)
+        
+        assert len(results) == len(dts)
+        for dt, positions in zip(dts, results):
+            assert positions == adapter.calc_positions(dt, sample_location, sample_settings)
+
 
 class TestHouseCalculations:
     """Test house system calculations."""
 
     def test_calc_houses_placidus(self, adapter, sample_settings, sample_location):
         """Test calculating Placidus houses."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             **sample_settings,
             "house_system": "placidus",
@@ -157,9 +177,6 @@ class TestHouseCalculations:
 
     def test_calc_houses_whole_sign(self, adapter, sample_settings, sample_location):
         """Test calculating Whole Sign houses."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             **sample_settings,
             "house_system": "whole_sign",
@@ -174,9 +191,6 @@ class TestHouseCalculations:
 
     def test_calc_houses_multiple_systems(self, adapter, sample_settings, sample_location):
         """Test multiple house systems."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         house_systems = ["placidus", "whole_sign", "koch", "equal", "regiomontanus"]
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -193,9 +207,6 @@ class TestHouseCalculations:
 
     def test_calc_houses_no_location(self, adapter, sample_settings):
         """Test that houses are None when no location provided."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         positions = adapter.calc_positions(dt, None, sample_settings)
         
@@ -207,9 +218,6 @@ class TestZodiacModes:
 
     def test_tropical_zodiac(self, adapter, sample_settings, sample_location):
         """Test tropical zodiac calculations."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             "zodiac_type": "tropical",
             "ayanamsa": None,
@@ -227,9 +235,6 @@ class TestZodiacModes:
 
     def test_sidereal_zodiac(self, adapter, sidereal_settings, sample_location):
         """Test sidereal zodiac calculations."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         positions = adapter.calc_positions(dt, sample_location, sidereal_settings)
         
@@ -240,9 +245,6 @@ class TestZodiacModes:
 
     def test_ayanamsa_configurations(self, adapter, sample_location):
         """Test different ayanamsa configurations."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         ayanamsas = ["lahiri", "fagan_bradley", "raman", "krishnamurti"]
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -257,15 +259,23 @@ class TestZodiacModes:
             positions = adapter.calc_positions(dt, sample_location, settings)
             assert "sun" in positions["planets"]
 
+    def test_adapters_do_not_share_sidereal_mode(self, adapter, sidereal_settings, sample_location):
+        """Test another adapter's ayanamsa does not leak into this adapter."""
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        before = adapter.calc_positions(dt, sample_location, sidereal_settings)
+        
+        other = SwissEphemerisAdapter(ephemeris_path=adapter.ephemeris_path)
+        other.calc_positions(dt, sample_location, {**sidereal_settings, "ayanamsa": "raman"})
+        
+        after = adapter.calc_positions(dt, sample_location, sidereal_settings)
+        assert after["planets"]["sun"]["lon"] == before["planets"]["sun"]["lon"]
+
 
 class TestErrorHandling:
     """Test error handling."""
 
     def test_invalid_planet_id(self, adapter, sample_settings, sample_location):
         """Test handling of invalid planet IDs."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             **sample_settings,
             "include_objects": ["invalid_planet"],
@@ -280,9 +290,6 @@ class TestErrorHandling:
 
     def test_empty_objects_list(self, adapter, sample_location):
         """Test handling of empty include_objects list."""
-        if adapter is None:
-            pytest.skip("Swiss Ephemeris files not available")
-        
         settings: EphemerisSettings = {
             "zodiac_type": "tropical",
             "ayanamsa": None,
@@ -0,0 +1,112 @@
+"""Tests for the caching layer."""
+
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from crius_swiss import CachedSwissEphemerisAdapter, EphemerisCache
+
+
+class TestEphemerisCache:
+    """Test EphemerisCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test a recently read entry survives eviction."""
+        cache = EphemerisCache(maxsize=2)
+        sun = {"lon": 280.0, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+        moon = {"lon": 10.0, "lat": 5.0, "speed_lon": 13.0, "retrograde": False}
+        mars = {"lon": 250.0, "lat": -1.0, "speed_lon": 0.7, "retrograde": False}
+        
+        cache.set_planet_position(2460311.0, "sun", 0, sun)
+        cache.set_planet_position(2460311.0, "moon", 0, moon)
+        assert cache.get_planet_position(2460311.0, "sun", 0) == sun
+        cache.set_planet_position(2460311.0, "mars", 0, mars)
+        
+        assert cache.get_planet_position(2460311.0, "sun", 0) == sun
+        assert cache.get_planet_position(2460311.0, "moon", 0) is None
+        assert cache.get_planet_position(2460311.0, "mars", 0) == mars
+        assert cache.get_stats()["planet_cache_size"] == 2
+
+    def test_import_does_not_load_swisseph(self):
+        """Test importing only EphemerisCache leaves swisseph unloaded."""
+        code = (
+            "import sys\n"
+            "from crius_swiss import EphemerisCache\n"
+            "assert 'swisseph' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestCachedAdapter:
+    """Test CachedSwissEphemerisAdapter."""
+
+    def test_repeat_request_served_from_layer_cache(
+        self, adapter, sample_settings, sample_location
+    ):
+        """Test repeated identical requests return the cached layer."""
+        cached_adapter = CachedSwissEphemerisAdapter(adapter)
+        
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        first = cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        second = cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        
+        assert second is first
+        assert first == adapter.calc_positions(dt, sample_location, sample_settings)
+
+    def test_stats_count_layer_hits(self, adapter, sample_settings, sample_location):
+        """Test repeated requests show up as hits in the cache statistics."""
+        cached_adapter = CachedSwissEphemerisAdapter(adapter)
+        
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        for _ in range(3):
+            cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        stats = cached_adapter.get_cache_stats()
+        
+        assert stats["layer_hits"] == 2
+        assert stats["layer_misses"] == 1
+        assert stats["layer_cache_size"] == 1
+        assert stats["hits"] == 2
+        assert stats["hit_rate"] > 0
+
+    def test_ayanamsas_cached_separately(self, adapter, sidereal_settings, sample_location):
+        """Test one ayanamsa's cached positions are not served for another."""
+        cached_adapter = CachedSwissEphemerisAdapter(adapter)
+        raman_settings = {**sidereal_settings, "ayanamsa": "raman"}
+        
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        cached_adapter.calc_positions(dt, sample_location, sidereal_settings)
+        raman = cached_adapter.calc_positions(dt, sample_location, raman_settings)
+        
+        assert raman == adapter.calc_positions(dt, sample_location, raman_settings)
+
+    def test_clear_cache_drops_layers(self, adapter, sample_settings, sample_location):
+        """Test clear_cache also clears cached layers."""
+        cached_adapter = CachedSwissEphemerisAdapter(adapter, cache=EphemerisCache(maxsize=4))
+        
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        first = cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        cached_adapter.clear_cache()
+        second = cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        
+        assert second is not first
+        assert second == first
+
+    def test_adapter_with_only_calc_positions(self, sample_settings, sample_location):
+        """Test objects providing only calc_positions get whole-request caching."""
+
+        class ProtocolOnlyAdapter:
+            calls = 0
+
+            def calc_positions(self, dt_utc, location, settings):
+                self.calls += 1
+                return {"planets": {}, "houses": None}
+
+        fake = ProtocolOnlyAdapter()
+        cached_adapter = CachedSwissEphemerisAdapter(fake)
+        
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        first = cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        second = cached_adapter.calc_positions(dt, sample_location, sample_settings)
+        
+        assert second is first
+        assert fake.calls == 1
@@ -0,0 +1,43 @@
+"""Tests for crius-swiss exceptions."""
+
+import pickle
+
+from crius_swiss import EphemerisCalculationError, EphemerisFileNotFoundError
+
+
+class TestEphemerisFileNotFoundError:
+    """Test EphemerisFileNotFoundError messages."""
+
+    def test_default_message(self):
+        """Test the default message names the path and how to fix it."""
+        error = EphemerisFileNotFoundError("/missing/swisseph")
+        message = str(error)
+        
+        assert message.startswith("Swiss Ephemeris data files not found at: /missing/swisseph\n")
+        assert "SWISS_EPHEMERIS_PATH" in message
+        assert error.path == "/missing/swisseph"
+
+    def test_custom_message(self):
+        """Test a custom message is used as-is."""
+        error = EphemerisFileNotFoundError("/missing/swisseph", "No .se1 files")
+        assert str(error) == "No .se1 files"
+
+    def test_pickle_round_trip(self):
+        """Test the exception survives pickling (e.g. across processes)."""
+        error = pickle.loads(pickle.dumps(EphemerisFileNotFoundError("/missing", "gone")))
+        assert error.path == "/missing"
+        assert str(error) == "gone"
+
+
+class TestEphemerisCalculationError:
+    """Test EphemerisCalculationError messages."""
+
+    def test_message_only(self):
+        """Test the message is used as-is without context."""
+        assert str(EphemerisCalculationError("Failed")) == "Failed"
+
+    def test_message_with_context(self):
+        """Test planet and datetime are appended to the message."""
+        error = EphemerisCalculationError("Failed", planet_id="sun", datetime="2024-01-01")
+        assert str(error) == "Failed (planet: sun) (datetime: 2024-01-01)"
+        assert error.planet_id == "sun"
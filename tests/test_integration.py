@@ -102,6 +102,8 @@ class TestIntegration:
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         
+        # Kept sequential: pyswisseph holds the GIL for the whole calculation
+        # (file reads included), so a thread pool would not overlap anything
         house_systems = []
         for loc in locations:
             positions = adapter.calc_positions(dt, loc, settings)
@@ -128,12 +130,8 @@ class TestIntegration:
         
         # Calculate for every hour over a day
         base_dt = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        positions_list = []
-        
-        for hour in range(24):
-            dt = base_dt + timedelta(hours=hour)
-            positions = adapter.calc_positions(dt, location, settings)
-            positions_list.append(positions)
+        dts = [base_dt + timedelta(hours=hour) for hour in range(24)]
+        positions_list = adapter.calc_positions_batch(dts, location, settings)
         
         # Verify all calculations succeeded
         assert len(positions_list) == 24
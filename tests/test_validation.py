@@ -0,0 +1,157 @@
+"""Tests for ephemeris file validation utilities."""
+
+import os
+
+import pytest
+
+from crius_swiss import (
+    DEFAULT_REQUIRED_FILES,
+    check_file_integrity,
+    check_file_integrity_entry,
+    find_ephemeris_files,
+    iter_ephemeris_files,
+    validate_ephemeris_files,
+    validate_ephemeris_path,
+)
+
+
+@pytest.fixture
+def ephemeris_dir(tmp_path):
+    """Directory with a couple of (fake) ephemeris files."""
+    for name in ["sepl_18.se1", "semo_18.se1", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"\0" * 2048)
+    return str(tmp_path)
+
+
+class TestValidateEphemerisPath:
+    """Test validate_ephemeris_path."""
+
+    def test_valid_directory(self, ephemeris_dir):
+        """Test a directory containing .se1 files is valid."""
+        is_valid, errors = validate_ephemeris_path(ephemeris_dir)
+        assert is_valid
+        assert not errors
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing path is reported."""
+        is_valid, errors = validate_ephemeris_path(str(tmp_path / "missing"))
+        assert not is_valid
+        assert errors[0].startswith("Path does not exist")
+
+    def test_directory_without_se1_files(self, tmp_path):
+        """Test a directory without .se1 files is invalid."""
+        is_valid, errors = validate_ephemeris_path(str(tmp_path))
+        assert not is_valid
+        assert errors[0].startswith("No .se1 files found")
+
+    def test_relative_path_after_chdir(self, tmp_path, monkeypatch):
+        """Test a relative path is re-listed after changing directory."""
+        with_files = tmp_path / "a" / "ephe"
+        without_files = tmp_path / "b" / "ephe"
+        with_files.mkdir(parents=True)
+        without_files.mkdir(parents=True)
+        (with_files / "sepl_18.se1").write_bytes(b"\0" * 2048)
+        # Same mtime for both, so only the directory identity tells them apart
+        mtime_ns = with_files.stat().st_mtime_ns
+        os.utime(without_files, ns=(mtime_ns, mtime_ns))
+        
+        monkeypatch.chdir(with_files.parent)
+        assert validate_ephemeris_path("ephe")[0]
+        monkeypatch.chdir(without_files.parent)
+        assert not validate_ephemeris_path("ephe")[0]
+
+
+class TestValidateEphemerisFiles:
+    """Test validate_ephemeris_files."""
+
+    def test_any_se1_file(self, ephemeris_dir):
+        """Test default check only requires some .se1 file."""
+        is_valid, errors = validate_ephemeris_files(ephemeris_dir)
+        assert is_valid
+        assert not errors
+
+    def test_required_files_present(self, ephemeris_dir):
+        """Test required files that exist pass."""
+        is_valid, errors = validate_ephemeris_files(
+            ephemeris_dir, required_files=["sepl_18.se1", "semo_18.se1"]
+        )
+        assert is_valid
+        assert not errors
+
+    def test_required_files_missing(self, ephemeris_dir):
+        """Test missing required files are listed in order."""
+        is_valid, errors = validate_ephemeris_files(
+            ephemeris_dir, required_files=["seas_18.se1", "sepl_18.se1", "seplm_18.se1"]
+        )
+        assert not is_valid
+        assert errors[0] == "Missing required files: seas_18.se1, seplm_18.se1"
+
+    def test_required_file_in_subdirectory(self, ephemeris_dir):
+        """Test required names with a subdirectory (asteroid layout) are found."""
+        os.mkdir(os.path.join(ephemeris_dir, "ast136"))
+        with open(os.path.join(ephemeris_dir, "ast136", "s136108s.se1"), "wb") as f:
+            f.write(b"\0" * 2048)
+        
+        is_valid, errors = validate_ephemeris_files(
+            ephemeris_dir, required_files=["sepl_18.se1", "ast136/s136108s.se1"]
+        )
+        assert is_valid
+        assert not errors
+
+    def test_default_required_files(self, ephemeris_dir):
+        """Test the default set reports its missing file."""
+        is_valid, errors = validate_ephemeris_files(
+            ephemeris_dir, required_files=DEFAULT_REQUIRED_FILES
+        )
+        assert not is_valid
+        assert errors[0] == "Missing required files: seas_18.se1"
+
+
+class TestCheckFileIntegrity:
+    """Test check_file_integrity and check_file_integrity_entry."""
+
+    def test_entry_matches_path_check(self, ephemeris_dir):
+        """Test checking a DirEntry gives the same result as its path."""
+        with open(os.path.join(ephemeris_dir, "tiny.se1"), "wb") as f:
+            f.write(b"\0" * 10)
+        
+        with os.scandir(ephemeris_dir) as entries:
+            for entry in entries:
+                assert check_file_integrity_entry(entry) == check_file_integrity(entry.path)
+
+    def test_entry_directory(self, ephemeris_dir):
+        """Test a directory entry is not a valid file."""
+        os.mkdir(os.path.join(ephemeris_dir, "sub.se1"))
+        with os.scandir(ephemeris_dir) as entries:
+            entry = next(e for e in entries if e.name == "sub.se1")
+        
+        is_valid, errors = check_file_integrity_entry(entry)
+        assert not is_valid
+        assert errors[0].startswith("Path is not a file")
+
+
+class TestFindEphemerisFiles:
+    """Test find_ephemeris_files and iter_ephemeris_files."""
+
+    def test_find_sorted(self, ephemeris_dir):
+        """Test only .se1 files are returned, sorted by path."""
+        assert find_ephemeris_files(ephemeris_dir) == [
+            os.path.join(ephemeris_dir, "semo_18.se1"),
+            os.path.join(ephemeris_dir, "sepl_18.se1"),
+        ]
+
+    def test_find_unsorted(self, ephemeris_dir):
+        """Test sort=False returns the same files."""
+        assert sorted(find_ephemeris_files(ephemeris_dir, sort=False)) == find_ephemeris_files(
+            ephemeris_dir
+        )
+
+    def test_iter_yields_entries(self, ephemeris_dir):
+        """Test the generator yields DirEntry objects for .se1 files."""
+        names = sorted(entry.name for entry in iter_ephemeris_files(ephemeris_dir))
+        assert names == ["semo_18.se1", "sepl_18.se1"]
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing directory yields nothing."""
+        assert find_ephemeris_files(tmp_path / "missing") == []
+        assert list(iter_ephemeris_files(tmp_path / "missing")) == []